@@ -6,7 +6,10 @@
 
 
 from typing import Tuple
-from numpy import array, clip, interp, log, uint8, float32
+from numpy import (
+    ndarray, array, asarray, clip, interp, log, maximum, stack, uint8,
+    float32)
+from numpy.typing import NDArray
 
 from lsd import FLOAT_PRECISION, rng
 from lsd.typing import RGBColor, uint8RGBColor
@@ -47,6 +50,18 @@ tertiary_colors: Tuple[uint8RGBColor, ...] = (
 neon_colors: Tuple[uint8RGBColor, ...] = (
     yellow, cyan, lime, magenta)
 """Bright neon colors."""
+_heat_scale = array([0.0, 0.4, 0.6, 0.9, 1.0])
+"""Relative temperatures of the :attr:`_heat_colors`.
+
+Shared by :func:`heat_color()` and :func:`heat_color_vec()` so both stay
+in sync.
+"""
+_heat_colors = array([(0, 0, 0), (180, 35, 35), (230, 105, 5), (230, 230, 55),
+                      (255, 255, 255)])
+"""Heat colors at the :attr:`_heat_scale` temperatures.
+
+Must have one color per :attr:`_heat_scale` entry.
+"""
 
 
 # ╭───────────────────────╮
@@ -248,6 +263,35 @@ def rainbow_color(pos: float) -> RGBColor:
     return array((_r, _g, _b))
 
 
+def rainbow_color_vec(pos: NDArray | float) -> ndarray:
+    """Gets rainbow colors for an array of color wheel positions.
+
+    Vectorized version of :func:`rainbow_color()` that converts all
+    positions at once.
+
+    Parameters
+    ----------
+    pos : :class:`numpy.ndarray`
+        Positions on the color wheel
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Colors with shape ``(*pos.shape, 3)``
+
+    See Also
+    --------
+    :func:`rainbow_color()`
+        Gets a single rainbow color
+    """
+
+    pos = asarray(pos, dtype=float) % (255 * 3)
+    _r = maximum(255 - pos, 0) + maximum(pos - 255 * 2, 0)
+    _g = maximum(255 - abs(pos - 255), 0)
+    _b = maximum(255 - abs(pos - 255 * 2), 0)
+    return stack((_r, _g, _b), axis=-1)
+
+
 def kelvin_color(kelvin: float) -> RGBColor:
     """Gives an RGB color for a kelvin temperature.
 
@@ -301,9 +345,8 @@ def heat_color(temp: float) -> RGBColor:
         Heat color
     """
 
-    sca = array([0.0, 0.4, 0.6, 0.9, 1.0])
-    col = array([(0, 0, 0), (180, 35, 35), (230, 105, 5), (230, 230, 55),
-                 (255, 255, 255)])
+    sca = _heat_scale
+    col = _heat_colors
 
     temp = min(max(temp, 0.), 2500.) / 2500.
     idx = max(0, min(sum(temp > sca) - 1, len(sca) - 2))
@@ -313,3 +356,30 @@ def heat_color(temp: float) -> RGBColor:
     _b = interp(temp, [sca[idx], sca[idx+1]], [col[idx][2], col[idx+1][2]])
 
     return clip_color((float(_r), float(_g), float(_b)))
+
+
+def heat_color_vec(temp: NDArray | float) -> ndarray:
+    """Gets black body radiation colors for an array of temperatures.
+
+    Vectorized version of :func:`heat_color()` that converts all
+    temperatures at once.
+
+    Parameters
+    ----------
+    temp : :class:`numpy.ndarray`
+        Celsius temperature values
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Heat colors with shape ``(*temp.shape, 3)``
+
+    See Also
+    --------
+    :func:`heat_color()`
+        Gets a single heat color
+    """
+
+    temp = clip(asarray(temp, dtype=float), 0., 2500.) / 2500.
+    return stack([interp(temp, _heat_scale, _heat_colors[:, ch])
+                  for ch in range(3)], axis=-1).astype(float32)
@@ -12,16 +12,16 @@ Notes
 """
 
 
-from time import sleep, perf_counter
+from time import sleep, perf_counter_ns
 from shutil import get_terminal_size
 from numbers import Number
 from rich.text import Text
 from rich.panel import Panel
-from numpy.typing import NDArray
+from numpy.typing import NDArray, DTypeLike
 from numpy import (
-    ndarray, floating, float32,
-    array, full, zeros, tile, column_stack, clip,
-    multiply, add, ones)
+    ndarray, floating, float32, uint8, dtype as npdtype,
+    array, asarray, full, zeros, tile, column_stack, clip, array_equal,
+    multiply, add, subtract, result_type, ones)
 from typing import Union, Any, Callable, Iterable, Generator
 from collections.abc import Sequence
 
@@ -69,6 +69,11 @@ class Image(ndarray):
     are adjusted whenever the instance :attr:`composite` is calculated.
     The mode can be enabled with :meth:`set_auto_opa_mode()`.
 
+    Images created with a pixel count keep colors and opacity in one
+    contiguous ``(pixels, 4)`` buffer. The image is a view on the first
+    three columns and :attr:`opa` a view on the last column, so both are
+    written to the same memory region.
+
     See Also
     --------
     :attr:`Image.bg`
@@ -99,13 +104,14 @@ class Image(ndarray):
 
     n: int
     """Number of pixels."""
-    opa: NDArray[floating]
-    """Opacity values for each pixel.
+    _opa: NDArray[floating]
+    """Holds opacity values.
 
-    Opacity controls the transparency and how much of the :attr:`bg` is
-    visible. At ``1.0`` the pixel is fully opaque. At ``0.0`` the pixel
-    is fully transparent.
+    .. note::
+        Use through :attr:`opa` property.
     """
+    _opa2d: NDArray[floating]
+    """Column view of :attr:`_opa` used for blending."""
     _bg: Union['Image', ndarray]
     """Holds background object.
 
@@ -128,6 +134,7 @@ class Image(ndarray):
                 opa: Union[float, Sequence[float]] = 1.,
                 mods: list[Callable] | None = None,
                 auto_opa: bool = False,
+                dtype: DTypeLike = float32,
                 **kwargs):
         """
         Parameters
@@ -142,12 +149,17 @@ class Image(ndarray):
             Modifiers to apply to the image :attr:`composite`
         auto_opa : bool, optional
             Automatically set opacity values
+        dtype : :class:`numpy.dtype`, optional
+            Data type of the colors if created with a pixel count
 
         Notes
         -----
         - :func:`__new__()` function is a requirement when subclassing
           :class:`numpy.ndarray` as stated here:
           https://numpy.org/doc/stable/user/basics.subclassing.html
+        - Only ``float32`` images keep colors and opacity in one buffer.
+          A ``uint8`` image holds colors that can directly be sent to a
+          strip, but values are clipped to the RGB range.
         """
 
         # Infer number of pixels for other object
@@ -163,9 +175,14 @@ class Image(ndarray):
                 " background (bg) or opacity (opa)")
 
         # Image
-        if isinstance(pixels, int):
+        rgba = None
+        if isinstance(pixels, int) and npdtype(dtype) == float32:
+            assert pixels > 0, "Image must have at least one pixel"
+            rgba = zeros((int(pixels), 4), dtype=float32)
+            obj = rgba[:, :3].view(cls)
+        elif isinstance(pixels, int):
             assert pixels > 0, "Image must have at least one pixel"
-            obj = tile(array((0, 0, 0), float32), (pixels, 1)).view(cls)
+            obj = zeros((int(pixels), 3), dtype=dtype).view(cls)
         elif is_img_data(pixels):
             obj = array(pixels).view(cls)
         else:
@@ -190,14 +207,18 @@ class Image(ndarray):
 
         # Opacity
         if isinstance(opa, (int, float)):
-            obj.opa = full(obj.n, opa, dtype=float32)
+            opa_values = full(obj.n, opa, dtype=float32)
         elif isinstance(opa, Sequence):
             assert len(opa) == obj.n, \
                 f"Opacity length differs image length ({len(opa)}, {obj.n})"
-            obj.opa = array(opa)
+            opa_values = array(opa)
         else:
             raise TypeError(
                 f"'opa' must be float or sequence of floats, not {type(opa)}")
+        if rgba is not None:
+            rgba[:, 3] = opa_values
+            opa_values = rgba[:, 3]
+        obj.opa = opa_values
 
         # Modifiers
         obj._modifiers = []
@@ -219,7 +240,7 @@ class Image(ndarray):
             return
 
         self._bg = getattr(obj, 'bg', array([black] * self.size))
-        self.opa = getattr(obj, 'opa', ones(self.size, dtype=float))
+        self.opa = getattr(obj, 'opa', ones(self.size, dtype=float32))
 
     def __repr__(self):
         return (self.__class__.__name__ + "(\n"
@@ -250,15 +271,24 @@ class Image(ndarray):
         :meth:`__getsubitem__()` : Retrieves a subitem value
         """
 
-        if isinstance(key, float):
+        # Fast paths for the common key types
+        key_type = type(key)
+        if key_type is float:
             return self.__getsubitem__(key)
-        values = super(Image, self).__getitem__(key)
-        if isinstance(key, int) or isinstance(key, tuple):
-            values = values.view(ndarray)
-        elif isinstance(key, slice):
-            values = values.view(Image)
+        if key_type is int or key_type is tuple:
+            return super().__getitem__(key).view(ndarray)
+        if key_type is slice:
+            values = super().__getitem__(key).view(Image)
             values.bg = self.bg[key]
             values.opa = self.opa[key]
+            return values
+
+        # Subclasses (e.g. numpy.float64) and array-like keys
+        if isinstance(key, float):
+            return self.__getsubitem__(key)
+        values = super().__getitem__(key)
+        if isinstance(key, (int, tuple)):
+            values = values.view(ndarray)
         return values
 
     def __getsubitem__(self, idx: float) -> RGBColor:
@@ -297,13 +327,21 @@ class Image(ndarray):
         key : int, float, slice, or array-like
             Index or indices to set in the instance
 
+        Notes
+        -----
+        - Values set to ``uint8`` images are clipped to the RGB range.
+
         See Also
         --------
         :meth:`__setsubitem__()`
             Sets a subitem value
         """
 
-        if isinstance(key, float):
+        if self.dtype == uint8:
+            value = self._clip_uint8(value)
+        key_type = type(key)
+        if key_type is not int and key_type is not slice \
+        and isinstance(key, float):  # noqa
             self.__setsubitem__(key, value)
             return
         super().__setitem__(key, value)  # type: ignore[return-value]
@@ -410,6 +448,25 @@ class Image(ndarray):
 
         self._bg = bg_instance
 
+    @property
+    def opa(self) -> NDArray[floating]:
+        """Opacity values for each pixel.
+
+        Opacity controls the transparency and how much of the :attr:`bg`
+        is visible. At ``1.0`` the pixel is fully opaque. At ``0.0`` the
+        pixel is fully transparent. Images created with a pixel count
+        store opacities as ``float32`` values.
+        """
+
+        return self._opa
+
+    @opa.setter
+    def opa(self, opa: NDArray[floating]):
+        """Sets the opacity values and the cached column view."""
+
+        self._opa = asarray(opa)
+        self._opa2d = self._opa.reshape(-1, 1)
+
     def set_bg(self, bg_instance: Union['Image', ndarray]):
         """Sets the background (:attr:Image.bg) for this object.
 
@@ -483,10 +540,12 @@ class Image(ndarray):
             self.auto_opa()
 
         # Calculate color data
-        _opa_reshape = self.opa.reshape(self.n, 1)
         bg_img = self.bg.composite if isinstance(self.bg, Image) else self.bg
-        real_img = add(multiply(self[:], _opa_reshape),
-                       multiply(bg_img, (1 - _opa_reshape)))
+        # Blend as ``bg + opa * (raw - bg)`` in a single output buffer
+        real_img = subtract(self[:], bg_img,
+                            dtype=result_type(self, self._opa, bg_img))
+        multiply(real_img, self._opa2d, out=real_img)
+        add(real_img, bg_img, out=real_img)
 
         # Apply modifiers
         for mod in self._modifiers:
@@ -539,6 +598,8 @@ class Image(ndarray):
         Notes
         -----
         - The **opa** gets clipped to range ``0.0``-``1.0``.
+        - The **color** gets clipped to the RGB range for ``uint8``
+          images.
         """
 
         if color is not None:
@@ -581,6 +642,38 @@ class Image(ndarray):
         if opa is not None:
             self.opa[idx] = clip(opa, 0., 1.)
 
+    def set_int_fast(self, idx: int, col: RGBColor):
+        """Sets a color to a pixel without validating it.
+
+        Faster alternative to :meth:`set()` and item assignment for hot
+        loops that only write single pixels. The **col** is written
+        directly to the image data, only ``uint8`` images clip it.
+
+        Parameters
+        ----------
+        idx : int
+            Pixel index
+        col : :attr:`lsd.typing.RGBColor`
+            Color to set at the pixel index
+
+        Notes
+        -----
+        - Subpixels are not supported here.
+        """
+
+        if self.dtype == uint8:
+            col = self._clip_uint8(col)
+        ndarray.__setitem__(self, idx, col)
+
+    @staticmethod
+    def _clip_uint8(value: Any) -> NDArray[uint8]:
+        """Clips color values to the RGB range of ``uint8`` images."""
+
+        value = asarray(value)
+        if value.dtype == uint8:
+            return value
+        return clip(value, 0, 255).astype(uint8)
+
     def auto_opa(self):
         """Changes the current opacity values based on colors.
 
@@ -876,6 +969,12 @@ class Strip(Image):
     .. note::
         Use through the :attr:`displayed` property.
     """
+    _synced: bool
+    """The :attr:`strip_driver` holds the :attr:`displayed` frame.
+
+    Unchanged frames are not pushed to the strip driver again once it is
+    in sync.
+    """
 
     def __new__(cls,
                 pixels: int | None = None,
@@ -914,6 +1013,7 @@ class Strip(Image):
             auto_opa=auto_opa,
             **kwargs)
         img._displayed = zeros((img.n, 3), dtype=int)
+        img._synced = False
         return img
 
     def __init__(self,
@@ -1014,7 +1114,9 @@ class Strip(Image):
         stack are advanced to the next frame. This can be prevented by
         setting the **advance** parameter. A duration (**dur**) can be
         stated to show this frame for a certain amount of time. This
-        will block the thread until the duration is over.
+        will block the thread until the duration is over. Frames equal
+        to the :attr:`displayed` frame are not sent to the strip driver
+        again.
 
         Parameters
         ----------
@@ -1041,11 +1143,14 @@ class Strip(Image):
             img = self
         if not isinstance(img, Image):
             img = Image(img, bg=self.bg)
-        frame = clip(img.composite.astype('uint8'), 0, 255)
-
-        self._displayed = frame
-        self.strip_driver[:] = frame
-        self.strip_driver.show()
+        frame = clip(img.composite, 0, 255).astype(uint8)
+
+        # Only push to the driver if the frame changed
+        if not (self._synced and array_equal(frame, self._displayed)):
+            self._displayed = frame
+            self.strip_driver[:] = frame
+            self.strip_driver.show()
+            self._synced = True
         if advance:
             img.__next_frame__()
         sleep(dur)
@@ -1153,13 +1258,13 @@ class Animation(Image):
         """
 
         # Checks
-        if not isinstance(visual, (Generator, Callable)):
+        if not (isinstance(visual, Generator) or callable(visual)):
             raise TypeError(
                 "'visual' must be a Generator or callable, not"
                 f" {type(pixels)}")
 
         img = Image.__new__(cls, pixels, bg, **kwargs)
-        if isinstance(visual, Callable):
+        if callable(visual):
             visual = visual(leds=img.n)
         img.visual = visual  # type: ignore
 
@@ -1226,12 +1331,14 @@ class Animation(Image):
         Notes
         -----
         - The initial update call is typically made by a :class:`Strip`.
+        - Colors and opacity of the frame are copied, so changes to the
+          animation never reach the frames of the visual.
         """
 
         if self.playback:
             try:
                 frame = next(self.visual)
-                self.opa = frame.opa
+                self.opa[:] = frame.opa
                 self[:] = frame[:]
             except StopIteration:
                 self.set_playback(False)
@@ -1278,12 +1385,22 @@ class Animation(Image):
                            " and will be updated twice during"
                            " playback.")
 
-        delay = 1. / fps
+        delay = int(1e9 / fps)
         self.set_playback(True)
-        start = perf_counter()
+        start = deadline = perf_counter_ns()
         while self.playback:
-            strip.show(img=self, dur=delay)
-            if max_dur is not None and perf_counter() - start > max_dur:
+            strip.show(img=self)
+
+            # Sleep until the next frame is due (accounts for show time)
+            deadline += delay
+            remaining = deadline - perf_counter_ns()
+            if remaining > 0:
+                sleep(remaining / 1e9)
+            else:
+                deadline -= remaining  # Running late, don't catch up
+
+            if max_dur is not None \
+            and perf_counter_ns() - start > max_dur * 1e9:  # noqa
                 break
 
 
@@ -5,11 +5,12 @@
 """Defines types and type checkers."""
 
 
-from numpy import ndarray, uint8, float32
+from numpy import ndarray, uint8, float32, asarray
 from typing import Union, Any
+from functools import singledispatch
 from numbers import Number
 from numpy.typing import NDArray
-from collections.abc import Sequence
+from collections.abc import Sequence, Sized
 
 from lsd import FLOAT_PRECISION
 
@@ -30,6 +31,7 @@ The values of this type can be negative and out of the ``0`` to ``255``
 """
 
 
+@singledispatch
 def is_color_value(obj: Any) -> bool:
     """Checks if the object can be interpreted a an RGB color.
 
@@ -55,9 +57,14 @@ def is_color_value(obj: Any) -> bool:
 
     Notes
     -----
-    - For a boolean iterable ``True`` is returned.
+    - For a boolean iterable ``True`` is returned, but boolean
+      :class:`numpy.ndarray` objects are rejected.
+    - Objects without a length, like generators, are never colors.
+      They are rejected without being consumed.
     """
 
+    if not isinstance(obj, Sized):
+        return False
     try:
         if len(obj) != 3:
             return False
@@ -69,6 +76,24 @@ def is_color_value(obj: Any) -> bool:
         return False
 
 
+@is_color_value.register
+def _is_color_value_array(obj: ndarray) -> bool:
+    """Checks arrays by shape and data type."""
+
+    if obj.dtype == object:
+        return is_color_value.dispatch(object)(obj)
+    return obj.ndim == 1 and obj.shape[0] == 3 and obj.dtype.kind in 'iufc'
+
+
+@is_color_value.register(tuple)
+@is_color_value.register(list)
+def _is_color_value_sequence(obj: tuple | list) -> bool:
+    """Checks tuples and lists without an iterator."""
+
+    return (len(obj) == 3 and isinstance(obj[0], Number)
+            and isinstance(obj[1], Number) and isinstance(obj[2], Number))
+
+
 def is_color(obj: Any) -> bool:
     """Check if the object is of type :attr:`RGBColor`.
 
@@ -130,8 +155,9 @@ def is_black_color(color: RGBColor) -> bool:
 def is_img_data(obj: Any) -> bool:
     """Checks if the object can be interpreted as an list of colors.
 
-    The object must be an iterable with a
-
+    The object must be an iterable with color values. Numeric data is
+    checked by its shape, other iterables are checked element-wise with
+    :func:`is_color_value()`.
 
     Parameters
     ----------
@@ -149,10 +175,28 @@ def is_img_data(obj: Any) -> bool:
         Checks if the object can be interpreted as a color
     :func:`is_color()`
         Checks if the object is a :attr:`RGBColor`
+
+    Notes
+    -----
+    - Objects without a length, like generators, are never image data.
+      They are rejected without being consumed.
+    - Empty sequences are image data without any pixels.
     """
 
     if isinstance(obj, ndarray):
         return obj.ndim == 2 and obj.shape[1] == 3
+
+    # Numeric data can be checked by its shape only
+    try:
+        arr = asarray(obj)
+    except (ValueError, TypeError):
+        arr = None
+    if arr is not None and arr.size and arr.dtype.kind in 'iufc':
+        return arr.ndim == 2 and arr.shape[1] == 3
+
+    # Check other iterables element-wise
+    if not isinstance(obj, Sized):
+        return False
     try:
         for el in iter(obj):
             if not is_color_value(el):
@@ -5,6 +5,7 @@
 """Various utilities."""
 
 
+from logging import DEBUG
 from time import perf_counter
 from timeit import timeit
 from typing import Any, Callable, Iterable
@@ -83,9 +84,13 @@ def track_runtime(func: Callable) -> Callable:
     -----
     - :attr:`lsd.utils.logging.logger` must be in debug mode to see the
       output, which is its default.
+    - The runtime is not measured while the logger level is above
+      debug. The level is checked on every call.
     """
 
     def wrapper(*args, **kwargs):
+        if not logger.isEnabledFor(DEBUG):
+            return func(*args, **kwargs)
         start_time = perf_counter()
         result = func(*args, **kwargs)
         end_time = perf_counter()
@@ -1,59 +1,85 @@
 #!usr/bin/env python3
 # -*- coding: utf-8 -*-
 # Copyright (c) 2025 OmegaDawn
-# flake8: noqa: E402
 
 """Emulates a LED strip driver for visualization on a PC monitor."""
 
 
-import os
-os.environ["QT_API"] = "PyQt6"
-
-
-import matplotlib  # noqa
-import matplotlib.pyplot as plt
 from typing import Any
-from ctypes import windll
 from time import sleep, perf_counter
-from multiprocessing import Process, freeze_support
-from multiprocessing.connection import PipeConnection, Pipe
-from numpy import ndarray, uint8, asarray, arange, expand_dims, zeros
+from multiprocessing import Process, Value, freeze_support
+from multiprocessing.connection import Connection, Pipe
+from multiprocessing.sharedctypes import Synchronized
+from multiprocessing.shared_memory import SharedMemory
+from numpy import (
+    ndarray, uint8, uint16, array, arange, zeros, array_equal,
+    dtype as npdtype)
+from PyQt6.QtCore import Qt, QRectF
+from PyQt6.QtGui import QImage, QPixmap, QPainter, QColor
+from PyQt6.QtWidgets import QApplication, QWidget
 
 from lsd.typing import uint8RGBColor
 from lsd.utils.logging import logger
 
 
-class Display:
-    """An updating :mod:`matplotlib` plot that visualizes a LED strip.
+class Display(QWidget):
+    """An updating :mod:`PyQt6` window that visualizes a LED strip.
 
-    Visualizes an RGB Strip in a new window. Strip data is gained from a
-    pipe. The plot can be slightly customized.
+    Visualizes an RGB Strip in a new window. Strip data is read from
+    shared memory whenever its frame counter changes. The pipe only
+    signals the setup and the termination of the emulator. The strip
+    data is held in a :class:`PyQt6.QtGui.QImage` with
+    one pixel per LED that is scaled to the window when painted. The
+    window can be slightly customized.
 
     Notes
     -----
-    - The plot can be closed by pressing the 'Q' key.
+    - The window can be closed by pressing the 'Q' key.
     """
 
-    pipe_conn: PipeConnection
-    """Connection to receive data from."""
+    pipe_conn: Connection
+    """Connection to the emulated strip driver."""
+    frame_seq: Synchronized
+    """Frame counter that is increased with each new frame.
+
+    Its lock is held while the shared frame is written or copied.
+    """
     dark_mode: bool
     """Display in dark/light mode."""
     pixels: int
     """Number of pixels in simulated strip."""
     ticks: bool
-    """Show ticks/pixel indexes on a-axis."""
+    """Show ticks/pixel indexes below the strip."""
     refresh_frames: int
     """UI frame updates since last :attr:`last_fps_time`."""
     update_frames: int
     """Strip data updates since last :attr:`last_fps_time`."""
     last_fps_time: float
     """Timestamp of last FPS calculation."""
+    _shm: SharedMemory
+    """Shared memory block holding the latest frame."""
+    _frame: ndarray
+    """Latest frame as view on :attr:`_shm`."""
+    _last_seq: int
+    """Last :attr:`frame_seq` value that was shown."""
+    _buffer: ndarray
+    """Strip color data shared with :attr:`_img`."""
+    _img: QImage
+    """Image with one pixel per LED wrapping :attr:`_buffer`."""
+    _pixmap: QPixmap
+    """Native copy of :attr:`_img` drawn to the window."""
+    _backdrop: QPixmap
+    """Window background with pixel indexes."""
+    _strip_rect: QRectF
+    """Area of the window the strip is drawn into."""
     _open: bool
-    """Plot is open and visible."""
+    """Window is open and visible."""
 
     def __init__(self,
-                 pipe_conn: PipeConnection,
+                 pipe_conn: Connection,
                  pixels: int,
+                 shm_name: str,
+                 frame_seq: Synchronized,
                  dark_mode: bool = True,
                  show_index: bool = False,
                  fps_limit: int = 60,
@@ -65,18 +91,22 @@ class Display:
 
         Parameters
         ----------
-        pipe_con : :mod:`multiprocessing.connection.PipeConnection`
-            Pipe to receive strip color data from
+        pipe_con : :class:`multiprocessing.connection.Connection`
+            Pipe to the emulated strip driver
         pixels : int
             Number of LEDs in the strip
+        shm_name : str
+            Name of the :class:`SharedMemory` holding the strip data
+        frame_seq : :class:`multiprocessing.sharedctypes.Synchronized`
+            Shared frame counter
         dark_mode : bool, optional
-            Plot in dark or light mode
+            Display in dark or light mode
         show_index : bool, optional
-            Shows the pixel index as x-axis tick
+            Shows the pixel indexes below the strip
         fps_limit : int, optional
-            Limits the plot refresh rate
+            Limits the window refresh rate
         hide_display : bool, optional
-            Debugging and testing option to hide the plot window
+            Debugging and testing option to hide the window
 
         Notes
         -----
@@ -88,7 +118,10 @@ class Display:
         logger.debug(
             "Initiating '%s' %s",
             self.__class__.__name__, "(hidden)" if hide_display else '')
+        app = QApplication.instance() or QApplication([])
+        super().__init__()
         self.pipe_conn = pipe_conn
+        self.frame_seq = frame_seq
         self.dark_mode = dark_mode
         self.pixels = pixels
         self.ticks = show_index
@@ -97,87 +130,127 @@ class Display:
         self.last_fps_time = 0
         self._open = True
 
-        # Create plot window
-        matplotlib.use('QT5Agg')
-        matplotlib.rcParams['toolbar'] = 'None'
-        self.fig = plt.figure(facecolor='black' if dark_mode else 'white')
-        self.ax = self.fig.add_subplot(111)
-        self.img = self.ax.imshow([[[0, 0, 0]] * pixels], aspect='auto',
-                                  interpolation='none')
+        # Shared strip data
+        self._shm = SharedMemory(name=shm_name, track=False)
+        self._frame = ndarray((1, pixels, 3), dtype=uint8,
+                              buffer=self._shm.buf)
+        self._last_seq = -1
+
+        # Create window
+        self._buffer = zeros((1, pixels, 3), dtype=uint8)
+        self._img = QImage(self._buffer.data, pixels, 1, 3 * pixels,
+                           QImage.Format.Format_RGB888)
+        self._pixmap = QPixmap.fromImage(self._img)
+        self._backdrop = QPixmap()
+        self._strip_rect = QRectF()
         self.set_plot_style()
-        self.fig.canvas.draw()
         if not hide_display:
-            plt.show(block=False)
-        self.bg = self.fig.canvas.copy_from_bbox(self.ax.bbox)  # type: ignore
+            self.show()
+        app.processEvents()
 
-        # Plot update loop
+        # Window update loop
         self.pipe_conn.send("$!Setup finished")
         if fps_limit == -1:
             while self._open:
                 self.visualize()
+                app.processEvents()
         else:
             delay = 1 / fps_limit
             while self._open:
                 self.visualize()
+                app.processEvents()
                 sleep(delay)
 
     def set_plot_style(self):
-        """Styles the plot window."""
+        """Styles the window."""
 
-        self.fig.canvas.manager.window.setGeometry(  # type: ignore
-            0, 0, windll.user32.GetSystemMetrics(0), 50)
-        self.fig.canvas.manager.set_window_title(  # type: ignore
-            f"Strip Display [{self.pixels} LEDs]")
-        self.fig.canvas.mpl_connect('close_event', self.closeEvent)
-        self.fig.subplots_adjust(0.01, 0.45, 0.99, 0.8)
+        screen_width = QApplication.primaryScreen().geometry().width()
+        self.setGeometry(0, 0, screen_width, 50)
+        self.setWindowTitle(f"Strip Display [{self.pixels} LEDs]")
 
-        ax = self.ax.axes
-        if ax is None:
-            return
-        ax.get_yaxis().set_visible(False)
+    def draw_backdrop(self):
+        """Draws the static window background for the current size.
+
+        The background color and the pixel indexes only change with the
+        window size, so they are drawn once into :attr:`_backdrop`.
+        """
+
+        width, height = self.width(), self.height()
+        self._strip_rect = QRectF(0.01 * width, 0.2 * height,
+                                  0.98 * width, 0.35 * height)
+        self._backdrop = QPixmap(self.size())
+        self._backdrop.fill(QColor('black' if self.dark_mode else 'white'))
         if not self.ticks:
-            ax.get_xaxis().set_visible(False)
-        ax.tick_params(axis='x', which='major',
-                       colors='white' if self.dark_mode else 'black')
-        ax.tick_params(axis='x', which='minor',
-                       colors='black' if self.dark_mode else 'white')
-        ax.set_xticks(arange(-.5, self.pixels, 1), minor=True)
-        ax.set_xticks(range(self.pixels))
+            return
+
+        # Pixel indexes
+        painter = QPainter(self._backdrop)
+        painter.setPen(QColor('white' if self.dark_mode else 'black'))
+        ticks = range(self.pixels)
         if self.pixels > 60:
-            ax.set_xticks(list(arange(0, self.pixels, self.pixels//20))
-                          + [self.pixels - 1])  # type: ignore
+            ticks = (list(arange(0, self.pixels, self.pixels // 20))
+                     + [self.pixels - 1])
+        pixel_width = self._strip_rect.width() / self.pixels
+        for tick in ticks:
+            x = self._strip_rect.left() + (tick + 0.5) * pixel_width
+            painter.drawText(
+                QRectF(x - 20, self._strip_rect.bottom(), 40,
+                       height - self._strip_rect.bottom()),
+                Qt.AlignmentFlag.AlignCenter, str(tick))
+        painter.end()
+
+    def paintEvent(self, event: Any = None):  # pylint: disable=w0613 # NOSONAR
+        """Paints the strip scaled onto the window background."""
+
+        if self._backdrop.size() != self.size():
+            self.draw_backdrop()
+        painter = QPainter(self)
+        painter.drawPixmap(0, 0, self._backdrop)
+        painter.drawPixmap(self._strip_rect, self._pixmap,
+                           QRectF(self._pixmap.rect()))
+        painter.end()
+
+    def keyPressEvent(self, event: Any):  # NOSONAR
+        """Closes the window when 'Q' is pressed."""
+
+        if event.key() == Qt.Key.Key_Q:
+            self.closeEvent()
 
     def visualize(self):
-        """Updates the plot with data from the pipe.
+        """Updates the window with the latest strip data.
 
         Could be called continuously for live updates. Data update and
         refresh rates are tracked and displayed in the window title.
-        Receiving ``None`` from the pipe is interpreted as termination
-        signal for the plot.
+        A closed pipe is interpreted as termination signal for the
+        window.
         """
 
-        # Get latest strip data
-        data = None
+        # Check for a terminated emulator
         try:
-            while self.pipe_conn.poll():
-                data = self.pipe_conn.recv()
-        except BrokenPipeError:
+            if self.pipe_conn.poll():
+                self.pipe_conn.recv()
+        except (BrokenPipeError, EOFError):
             self.closeEvent()
             return
 
-        # Update plot
-        if data is not None:
-            self.update_frames += 1
-            self.img.set_data(data)
-            self.fig.canvas.restore_region(self.bg)  # type: ignore
-            self.ax.draw_artist(self.img)
-            self.fig.canvas.blit(self.ax.bbox)  # type: ignore
-            self.fig.canvas.flush_events()
+        # Update image with the latest frame if it differs
+        seq = self.frame_seq.value
+        if seq != self._last_seq:
+            with self.frame_seq.get_lock():  # Frame is not written now
+                seq = self.frame_seq.value
+                changed = not array_equal(self._frame, self._buffer)
+                if changed:
+                    self._buffer[:] = self._frame
+            if changed:
+                self.update_frames += 1
+                self._pixmap.convertFromImage(self._img)
+                self.update()
+        self._last_seq = seq
 
         # Calculate updates per second
         self.refresh_frames += 1
         if perf_counter() - self.last_fps_time > 1:
-            self.fig.canvas.manager.set_window_title(  # type: ignore
+            self.setWindowTitle(
                 "Strip Display "
                 + f"[{self.pixels} LEDs] "
                 + f"[{self.refresh_frames} FPS] "
@@ -187,22 +260,29 @@ class Display:
             self.last_fps_time = perf_counter()
 
     def closeEvent(self, event: Any = None):  # pylint: disable=w0613 # NOSONAR
-        """Terminates the plot window."""
+        """Terminates the window."""
 
         if not self._open:
             return
         self._open = False
         logger.debug("Closing '%s' window", self.__class__.__name__)
-        plt.close(self.fig)
+        del self._frame
+        self._shm.close()
+        self.close()
 
 
-class NeoPixel(ndarray):
+class NeoPixel:
     """Emulates the :class:`neopixel.NeoPixel` class.
 
     This emulates the functionality of the *Adafruit* :mod:`neopixel`
-    library as a :mod:`numpy` array. The strip driver is simulated so that
-    instead of applying the color data to a physical LED strip, the data
-    is visualized onto the monitor using the :class:`Display`.
+    library. The strip driver is simulated so that instead of applying
+    the color data to a physical LED strip, the data is visualized onto
+    the monitor using the :class:`Display`.
+
+    The color data is stored channel by channel (:attr:`_channels`) so
+    that each channel is contiguous in memory. Indexing works like on a
+    ``(n, 3)`` :class:`numpy.ndarray` of pixels and the instance can be
+    converted with :func:`numpy.asarray`.
 
     See Also
     --------
@@ -227,12 +307,27 @@ class NeoPixel(ndarray):
     """Color channel order. See :class:`neopixel.NeoPixel`."""
     channel_order: list
     """Channel order interpretation."""
-    pipe_conn: PipeConnection
+    _identity_order: bool
+    """The :attr:`channel_order` does not reorder channels."""
+    _channels: ndarray
+    """Color data with shape ``(3, n)``, one row per channel."""
+    pipe_conn: Connection
     """Connection to the :class:`Display`."""
+    frame_seq: Synchronized
+    """Frame counter shared with the :class:`Display`.
 
-    def __new__(cls, pin: Any, n: int, *, bpp: int = 3,
-                brightness: float = 1.0, auto_write: bool = False,
-                pixel_order: str = 'RGB', **display_kwargs):
+    Its lock is held while the shared frame is written or copied.
+    """
+    _shm: SharedMemory
+    """Shared memory block the shown frames are written to."""
+    _frame: ndarray
+    """View on :attr:`_shm` in the shape of the strip data."""
+    _display: Process
+    """Process running the :class:`Display`."""
+
+    def __init__(self, pin: Any, n: int, *, bpp: int = 3,
+                 brightness: float = 1.0, auto_write: bool = False,
+                 pixel_order: str = 'RGB', **display_kwargs):
         """
         Parameters
         ----------
@@ -259,32 +354,37 @@ class NeoPixel(ndarray):
         if auto_write:
             logger.warning(
                 "The '%s' emulation does not support 'auto_write'",
-                cls.__name__)
+                self.__class__.__name__)
             auto_write = False
         if bpp != 3 or 'w' in pixel_order.lower():
             logger.warning(
                 "The '%s' emulation does not support white channels. "
                 "'bpp' and 'pixel_order' arguments have limited effect",
-                cls.__name__)
+                self.__class__.__name__)
             pixel_order = 'RGB'
 
-        obj = zeros((n, 3), dtype=uint8).view(cls)
-        obj.pin = pin
-        obj.brightness = brightness
-        obj.auto_write = auto_write
-        obj.pixel_order = pixel_order
-        obj.channel_order = [pixel_order.lower().index(ch) for ch in 'rgb']
-        obj.pipe_conn, pipe_conn = Pipe()
+        self.pin = pin
+        self.brightness = brightness
+        self.auto_write = auto_write
+        self.pixel_order = pixel_order
+        self.channel_order = [pixel_order.lower().index(ch) for ch in 'rgb']
+        self._identity_order = self.channel_order == [0, 1, 2]
+        self._channels = zeros((3, n), dtype=uint8)
+        self.pipe_conn, pipe_conn = Pipe()
+        self.frame_seq = Value('L', 0)
+        self._shm = SharedMemory(create=True, size=n * 3)
+        self._frame = ndarray((n, 3), dtype=uint8, buffer=self._shm.buf)
 
         freeze_support()
-        Process(target=Display,
-                args=(pipe_conn, n),
-                kwargs=display_kwargs,
-                daemon=True).start()
+        self._display = Process(target=Display,
+                                args=(pipe_conn, n, self._shm.name,
+                                      self.frame_seq),
+                                kwargs=display_kwargs,
+                                daemon=True)
+        self._display.start()
 
-        obj.pipe_conn.recv()  # Await Display setup
-        obj.show()
-        return obj
+        self.pipe_conn.recv()  # Await Display setup
+        self.show()
 
     def __del__(self):
         self.close()
@@ -297,7 +397,25 @@ class NeoPixel(ndarray):
         self.close()
 
     def __repr__(self):
-        return "[" + ", ".join([str(x) for x in self]) + "]"
+        return "[" + ", ".join([str(x) for x in self._channels.T]) + "]"
+
+    def __len__(self) -> int:
+        return self._channels.shape[1]
+
+    def __getitem__(self, key: Any) -> ndarray:
+        return self._channels.T[key]
+
+    def __setitem__(self, key: Any, value: Any):
+        self._channels.T[key] = value
+
+    def __array__(self, dtype: Any = None, copy: bool | None = None
+                  ) -> ndarray:
+        if copy is False:
+            if dtype is not None and npdtype(dtype) != uint8:
+                raise ValueError(
+                    f"Converting pixels to {dtype} requires a copy")
+            return self._channels.T
+        return array(self._channels.T, dtype=dtype or uint8, order='C')
 
     @property
     def n(self) -> int:
@@ -317,23 +435,34 @@ class NeoPixel(ndarray):
             RGB color tuple
         """
 
-        self[:] = value
+        for channel, channel_value in zip(self._channels, value):
+            channel[:] = channel_value
 
     def show(self):
         """Makes changes visible on the LED strip.
 
-        For the emulation the data will be send trough a
-        :class:`multiprocessing.Pipe` to the display.
+        For the emulation the data is written to shared memory and the
+        frame counter is increased so that the display picks it up. The
+        :attr:`brightness` is applied to the written data. Frames equal
+        to the last shown frame are not written again.
         """
 
-        data = expand_dims(asarray(self)[:, self.channel_order], axis=0
-                           ).astype(int)
-        try:
-            self.pipe_conn.send(data)
-        except BrokenPipeError:
+        if not self._display.is_alive():
             logger.warning("'%s' emulator terminates because '%s' was closed",
                            self.__class__.__name__,  Display.__name__)
             exit()
+        channels = self._channels
+        if not self._identity_order:
+            channels = channels[self.channel_order]
+        if self.brightness < 1.0:
+            channels = (channels.astype(uint16) * int(self.brightness * 256)
+                        >> 8).astype(uint8)
+        frame = channels.T
+        if array_equal(frame, self._frame):
+            return
+        with self.frame_seq.get_lock():  # Display can't copy half a frame
+            self._frame[:] = frame
+            self.frame_seq.value += 1
 
     def close(self):
         """Close Display when terminating."""
@@ -341,4 +470,10 @@ class NeoPixel(ndarray):
         try:
             self.pipe_conn.close()
         except AttributeError:
+            return
+        try:
+            del self._frame
+            self._shm.close()
+            self._shm.unlink()
+        except (AttributeError, FileNotFoundError):
             pass
@@ -5,12 +5,20 @@
 """Utilities for formatting data."""
 
 
-from rich.text import Text
-from numpy import clip, ndarray, uint8
+from math import floor, log10
+from functools import lru_cache
+from rich.text import Text, Span
+from numpy import clip, ndarray, uint8, uint32
 
 from lsd.typing import is_img_data
 
 
+_FACTORS = (86400.0, 3600.0, 60.0, 1.0, 1e-3, 1e-6, 1e-9)
+"""Time unit factors in [sec] used by :func:`format_time()`."""
+_UNITS = ('d', 'h', 'min', 'sec', 'ms', 'µs', 'ns')
+"""Time unit names matching :data:`_FACTORS`."""
+
+
 def format_time(time: float, decimal_places: int = 2) -> str:
     """Converts a duration to its best suited unit.
 
@@ -38,21 +46,23 @@ def format_time(time: float, decimal_places: int = 2) -> str:
     '1.234 ns'
     """
 
-    units = [(86400.0, 'd'),
-             (3600.0, 'h'),
-             (60.0, 'min'),
-             (1.0, 'sec'),
-             (1e-3, 'ms'),
-             (1e-6, 'µs'),
-             (1e-9, 'ns'),]
+    # Calendar units are compared directly, decimal units by magnitude
+    abs_time = abs(time)
+    if abs_time >= 60.0:
+        idx = 0 if abs_time >= 86400.0 else 1 if abs_time >= 3600.0 else 2
+    elif abs_time >= 1e-9:
+        idx = 3 + min(3, max(0, (2 - floor(log10(abs_time))) // 3))
+    else:
+        idx = 6
+    _time = round(time / _FACTORS[idx], decimal_places)
+    return f'{_time:.{decimal_places}f} {_UNITS[idx]}'
+
+
+@lru_cache(maxsize=4096)
+def _rgb_style(key: int) -> str:
+    """Gives the :mod:`rich` style for a packed ``0xRRGGBB`` color."""
 
-    unit = 'sec'  # NOSONAR
-    for factor, unit in units:
-        if abs(time) >= factor:
-            time /= factor
-            break
-    _time = round(time, decimal_places)
-    return f'{_time:.{decimal_places}f} {unit}'
+    return f"rgb({key >> 16},{(key >> 8) & 255},{key & 255})"
 
 
 def img_to_text(img: ndarray, name: str = '', padding: int = 0,
@@ -99,10 +109,14 @@ def img_to_text(img: ndarray, name: str = '', padding: int = 0,
     # Image line
     str_img = Text(no_wrap=True)
     str_img.append(f"{name}".ljust(padding), style='bold')
-    for pixel in img:
-        r, g, b = pixel
-        cvt_color = f"rgb({r},{g},{b})"
-        str_img.append("█", style=cvt_color.replace(" ", ""))
+    offset = len(str_img)
+    str_img.append("█" * len(img))
+    keys = (img[:, 0].astype(uint32) << 16
+            | img[:, 1].astype(uint32) << 8
+            | img[:, 2])
+    str_img.spans.extend(
+        Span(offset + i, offset + i + 1, _rgb_style(key))
+        for i, key in enumerate(keys.tolist()))
 
     # Index line
     if show_idx:
@@ -11,6 +11,11 @@ displayed on the strip. All visuals must have a ``'leds'`` parameter so
 that the generated size can be set to the requirements of an
 :class:`Animation`.
 
+Visuals allocate their frames once and yield the same
+:class:`lsd.strip.Image` objects repeatedly. A yielded frame is only
+valid until the next frame is requested and should not be modified by
+the consumer.
+
 See Also
 --------
 :class:`lsd.strip.Animation`
@@ -19,23 +24,134 @@ See Also
 
 
 from random import choice
+from itertools import islice
+from threading import Event
 from typing import Generator
 
-from numpy import arange, array, zeros, exp, minimum, maximum, clip
+from numpy import (
+    arange, array, zeros, empty, stack, exp, minimum, maximum, clip,
+    convolve, take, where, add, subtract, multiply, divide, greater,
+    putmask, linspace, ndarray, float32)
 from numpy.random import default_rng
 
 from lsd import MAIN_COLOR
-from lsd.colors import random_tertiary, heat_color, white
+from lsd.colors import random_tertiary, heat_color_vec, white, black
 from lsd.strip import Image
 from lsd.typing import RGBColor
 
 
 rng = default_rng()  # NOSONAR
-RUNNING = True
-"""Flag indicating infinite visuals should keep running.
+_RUNNING = Event()
+"""Event indicating visuals should keep running.
 
-This can be set to ``False`` to stop infinite visuals from generating.
+Visuals bind :meth:`threading.Event.is_set` locally and check it each
+frame. Use :func:`set_running()` to change it.
 """
+_RUNNING.set()
+
+
+def set_running(enabled: bool = True):
+    """Sets whether visuals keep generating frames.
+
+    Disabling stops infinite visuals (and finite visuals early) the next
+    time they check the flag. Visuals can be enabled again afterwards.
+
+    Parameters
+    ----------
+    enabled : bool, optional
+        Allow or stop the generation of frames
+    """
+
+    if enabled:
+        _RUNNING.set()
+    else:
+        _RUNNING.clear()
+
+
+def finite_to_batch(visual: Generator[Image, None, None],
+                    n_frames: int | None = None) -> ndarray:
+    """Collects the frames of a visual into one array.
+
+    Every frame is copied into a row of *RGBA* values, the opacity is
+    the last channel. Infinite visuals need a limit of **n_frames**.
+
+    Parameters
+    ----------
+    visual : Generator[Image, None, None]
+        Visual to collect the frames from
+    n_frames : int, optional
+        Maximum number of frames to collect
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        Frames with shape ``(n_frames, leds, 4)``
+
+    See Also
+    --------
+    :func:`batch_frames()`
+        Plays a batch of frames as a visual
+    """
+
+    frames = []
+    for img in islice(visual, n_frames):
+        frame = empty((len(img), 4), dtype=float32)
+        frame[:, :3] = img
+        frame[:, 3] = img.opa
+        frames.append(frame)
+    if not frames:
+        return zeros((0, 0, 4), dtype=float32)
+    return stack(frames)
+
+
+def batch_frames(batch: ndarray) -> Generator[Image, None, None]:
+    """Finite visual playing a batch of precomputed frames.
+
+    Parameters
+    ----------
+    batch : :class:`numpy.ndarray`
+        *RGBA* frames with shape ``(n_frames, leds, 4)``
+
+    Yields
+    ------
+    :class:`lsd.strip.Image`
+        Generated frame
+
+    See Also
+    --------
+    :func:`finite_to_batch()`
+        Collects the frames of a visual
+    :func:`runner_batch()`
+        Batch of :func:`runner()` frames
+    """
+
+    if len(batch) == 0:
+        return
+    img = Image(batch.shape[1], opa=0.)
+    is_running = _RUNNING.is_set
+    for frame in batch:
+        if not is_running():
+            break
+        img[:] = frame[:, :3]
+        img.opa[:] = frame[:, 3]
+
+        yield img
+
+
+def _draw_block(opa: ndarray, pos: float, width: float, pixels: ndarray):
+    """Sets the opacity of pixels covered by a block.
+
+    Each pixel gets the share of its width that is covered by the block
+    from **pos** to **pos** + **width** as opacity. **pixels** are the
+    pixel indices matching **opa**. Every value of **opa** is written,
+    so it does not need to be cleared beforehand. A column of positions
+    draws one block per row of a 2D **opa**.
+    """
+
+    # Trapezoid rising after pos and falling before the block end
+    subtract(pos + width, pixels, out=opa)
+    minimum(opa, pixels + (1 - pos), out=opa)
+    clip(opa, 0, min(1, width), out=opa)
 
 
 def binary_count(leds: int,
@@ -65,11 +181,12 @@ def binary_count(leds: int,
     img.fill(color)
 
     max_number = 1 << leds
+    shifts = arange(leds - 1, -1, -1)
+    is_running = _RUNNING.is_set
     for number in range(max_number):
-        if not RUNNING:
+        if not is_running():
             break
-        for pos in range(leds):
-            img.opa[pos] = (number >> (leds - 1 - pos)) & 1
+        img.opa[:] = (number >> shifts) & 1
 
         yield img
 
@@ -78,6 +195,7 @@ def blink(leds: int,
           on: RGBColor = MAIN_COLOR, off: RGBColor = (0, 0, 0),
           on_opa: float = 1., off_opa: float = 0.,
           on_frames: int = 5, off_frames: int = 5,
+          copy_on_yield: bool = False
           ) -> Generator[Image, None, None]:
     """Infinite blink effect.
 
@@ -101,22 +219,45 @@ def blink(leds: int,
         Number of frames to hold the 'on' state
     off_frames : int, optional
         Number of frames to hold the 'off' state
+    copy_on_yield : bool, optional
+        Yield a copy of the state images instead of the images itself
 
     Yields
     ------
     :class:`lsd.strip.Image`
         Generated frame
+
+    Notes
+    -----
+    - By default the two state images are yielded directly. Their
+      colors and opacity are read-only so consumers can rely on them
+      not changing.
+      With **copy_on_yield** they are copied into a single output image
+      that is allocated once, so the consumer can modify the frame.
     """
 
     on_img = Image(leds, opa=on_opa)
     off_img = Image(leds, opa=off_opa)
     on_img.fill(on)
     off_img.fill(off)
-    while RUNNING:
-        for _ in range(on_frames):
-            yield on_img
-        for _ in range(off_frames):
-            yield off_img
+    for state_img in (on_img, off_img):
+        state_img.setflags(write=False)
+        state_img.opa.setflags(write=False)
+    schedule = [on_img] * on_frames + [off_img] * off_frames
+    if not schedule:
+        return
+    is_running = _RUNNING.is_set
+    if not copy_on_yield:
+        while is_running():
+            yield from schedule
+        return
+
+    out_img = Image(leds)
+    while is_running():
+        for state_img in schedule:
+            out_img[:] = state_img
+            out_img.opa[:] = state_img.opa
+            yield out_img
 
 
 def rainbow(leds: int, speed: float = 1) -> Generator[Image, None, None]:
@@ -149,8 +290,9 @@ def rainbow(leds: int, speed: float = 1) -> Generator[Image, None, None]:
     img = Image(leds, opa=1.)
     pos = 0
     loop = 255 * 3
+    is_running = _RUNNING.is_set
 
-    while RUNNING:
+    while is_running():
         color = rainbow_color(pos)
         img[:] = color
         pos = (pos + speed) % loop
@@ -188,15 +330,16 @@ def rainbow_wave(leds: int, scale: float = 1, speed: float = 0.1
         Another rainbow effect where the whole strip has the same color
     """
 
-    from lsd.colors import rainbow_color
+    from lsd.colors import rainbow_color_vec
 
     img = Image(leds, opa=1.)
     scale = 256 * 3 * scale / leds
     pos = 0
+    offsets = arange(leds) * scale
+    is_running = _RUNNING.is_set
 
-    while RUNNING:
-        for i in range(leds):
-            img[i] = rainbow_color((pos + i) * scale)
+    while is_running():
+        img[:] = rainbow_color_vec(offsets + pos * scale)
         pos = (pos + speed) % 256
         yield img
 
@@ -236,17 +379,49 @@ def runner(leds: int, color: RGBColor = MAIN_COLOR, width: float = 1,
 
     img = Image(leds, opa=0.)
     img.fill(color)
-    for pos in arange(0, leds-width, step_size):
-        if not RUNNING:
+    pixels = arange(leds)
+    positions = arange(0, leds-width, step_size).tolist()
+    is_running = _RUNNING.is_set
+    for pos in positions:
+        if not is_running():
             break
-        img.opa[:int(pos)] = 0.
-        img.opa[int(pos)] = 1. - (pos % 1.)
-        img.opa[int(pos + width)] = (pos + width) % 1.
-        img.opa[int(pos + 1.):int(pos + width)] = 1.
+        _draw_block(img.opa, pos, width, pixels)
 
         yield img
 
 
+def runner_batch(leds: int, color: RGBColor = MAIN_COLOR, width: float = 1,
+                 step_size: float = 0.10) -> ndarray:
+    """All frames of :func:`runner()` computed at once.
+
+    The block opacities of every position are calculated in one
+    vectorized step instead of frame by frame. Play the result with
+    :func:`batch_frames()`.
+
+    Parameters
+    ----------
+    leds : int
+        Size of the frames to generate
+    color : RGBColor, optional
+        Color of the running block
+    width : float, optional
+        Pixel width of the running block
+    step_size : float, optional
+        Distance traveled per frame
+
+    Returns
+    -------
+    :class:`numpy.ndarray`
+        *RGBA* frames with shape ``(n_frames, leds, 4)``
+    """
+
+    positions = arange(0, leds-width, step_size)
+    batch = zeros((len(positions), leds, 4), dtype=float32)
+    batch[:, :, :3] = color
+    _draw_block(batch[:, :, 3], positions[:, None], width, arange(leds))
+    return batch
+
+
 def pong(leds: int, color: RGBColor = MAIN_COLOR, width: float = 1,
          step_size: float = 1) -> Generator[Image, None, None]:
     """Block bouncing between the ends of the strip.
@@ -277,14 +452,11 @@ def pong(leds: int, color: RGBColor = MAIN_COLOR, width: float = 1,
     img.fill(color)
     pos = 0.0
     direction = 1
+    pixels = arange(leds)
+    is_running = _RUNNING.is_set
 
-    while RUNNING:
-        img.opa[:] = 0.
-        pixel_edges = arange(leds + 1)
-        lefts = maximum(pixel_edges[:-1], pos)
-        rights = minimum(pixel_edges[1:], pos + width)
-        coverages = clip(rights - lefts, 0, 1)
-        img.opa[:] = coverages
+    while is_running():
+        _draw_block(img.opa, pos, width, pixels)
 
         yield img
 
@@ -341,18 +513,22 @@ def comet(leds: int, color: RGBColor = MAIN_COLOR, width: float = 2,
     _fade = 1 - fade_amount
     img = Image(leds, opa=0.)
     img.fill(color)
-    for pos in arange(0, leds - width, step_size):
-        if not RUNNING:
+    pixels = arange(leds)
+    fade_draws = zeros(leds)
+    positions = arange(0, leds - width, step_size)
+    tails = positions.astype(int)
+    is_running = _RUNNING.is_set
+    for pos, tail in zip(positions.tolist(), tails.tolist()):
+        if not is_running():
             break
 
         # Fade
-        for i in range(int(pos)):
-            if rng.random() < fade_prob:
-                img.opa[i] *= _fade
+        if tail:
+            draws = rng.random(out=fade_draws[:tail])
+            img.opa[:tail] *= where(draws < fade_prob, _fade, 1.)
 
-        # Move comet
-        img.opa[int(pos + width)] = (pos + width) % 1.
-        img.opa[int(pos):int(pos + width)] = 1.
+        # Move comet, the head pixel stays fully opaque
+        _draw_block(img.opa[tail:], tail, pos + width - tail, pixels[tail:])
 
         yield img
 
@@ -389,7 +565,9 @@ def sparkling(leds: int, color: RGBColor = MAIN_COLOR, sparks: int = 1,
     _fade = 1 - fade_pct
 
     alive = zeros(leds, dtype=int)
-    while RUNNING:
+    lit = zeros(leds, dtype=bool)
+    is_running = _RUNNING.is_set
+    while is_running():
         # New sparks
         new_sparks = rng.integers(0, leds, size=sparks)
         alive[new_sparks] = alive_frames
@@ -397,11 +575,12 @@ def sparkling(leds: int, color: RGBColor = MAIN_COLOR, sparks: int = 1,
         # Render frame
         img.opa *= _fade
         img[new_sparks] = color
-        img.opa[alive > 0] = 1.
+        greater(alive, 0, out=lit)
+        putmask(img.opa, lit, 1.)
 
         yield img
 
-        alive -= 1
+        subtract(alive, 1, out=alive, where=lit)
 
 
 def bouncer(leds: int):
@@ -427,34 +606,30 @@ def bouncer(leds: int):
     velocity = choice([-1, +1])
     color = random_tertiary()
     block_pos = rng.integers(0, leds)
+    is_running = _RUNNING.is_set
 
-    while RUNNING:
-        img.clear()
-        img.opa[:] = 0
+    while is_running():
+        # Clear the pixels drawn in the previous frame
+        img.set_int_fast(pos, black)
+        img.set_int_fast(block_pos, black)
+        img.opa[pos] = img.opa[block_pos] = 0.
 
-        # Get new bouncer pos
+        # Get new bouncer pos, bounce at the strip ends and the block
         new_bouncer_pos = int(pos + velocity)
-        if new_bouncer_pos < 0:
-            color = random_tertiary()
-            new_bouncer_pos = 0
-            velocity *= -1
-        if new_bouncer_pos >= leds-1:
+        hit_block = new_bouncer_pos == block_pos
+        if hit_block or new_bouncer_pos < 0 or new_bouncer_pos >= leds-1:
             color = random_tertiary()
-            new_bouncer_pos = leds-1
-            velocity *= -1
-        if (velocity > 0 and pos + velocity) == block_pos \
-        or (velocity < 0 and pos + velocity) == block_pos:  # noqa
-            color = random_tertiary()
-            velocity *= -1
-            block_pos = rng.integers(0, leds)
+            velocity = -velocity
+            new_bouncer_pos = min(max(new_bouncer_pos, 0), leds-1)
+            if hit_block:
+                block_pos = rng.integers(0, leds)
         pos = new_bouncer_pos
 
         # Draw image
-        img[block_pos] = white
-        img[new_bouncer_pos] = color
-        img.opa[new_bouncer_pos] = 1.
+        img.set_int_fast(block_pos, white)
+        img.set_int_fast(new_bouncer_pos, color)
         img.opa[block_pos] = 1.
-        img.set(new_bouncer_pos, color, 1.)
+        img.opa[new_bouncer_pos] = 1.
 
         yield img
 
@@ -496,8 +671,9 @@ def bars(leds: int, sections: int = 10, light_up_prob: float = 0.2,
     sec_pixels = leds / sections
     fade_pct = 1 / fade_frames
     img = Image(leds, opa=0)
+    is_running = _RUNNING.is_set
 
-    while RUNNING:
+    while is_running():
 
         # Fade
         img.opa[:] -= fade_pct
@@ -573,13 +749,21 @@ def bouncing_ball(leds: int, color: RGBColor = MAIN_COLOR, tail: float = 2,
         pos = leds + pos
     img = Image(leds, opa=0.)
     img.fill(color)
-
-    while RUNNING:
-        # Place ball pixel (subpixel)
-        if pos + 1 < leds:
-            img.opa[int(pos + 1)] = pos % 1
-        if pos < leds:
-            img.opa[int(pos)] = 1 - pos % 1
+    ramp = arange(leds, dtype=float32)
+    pixels = arange(leds)
+    dirty_start, dirty_end = 0, 0
+    is_running = _RUNNING.is_set
+
+    while is_running():
+        # Clear only the pixels drawn in the previous frame
+        img.opa[dirty_start:dirty_end] = 0.
+
+        # Place ball pixel (subpixel), it covers at most two pixels
+        ball_start = min(max(int(pos), 0), leds)
+        ball_end = min(ball_start + 2, leds)
+        _draw_block(img.opa[ball_start:ball_end], pos, 1,
+                    pixels[ball_start:ball_end])
+        dirty_start, dirty_end = ball_start, ball_end
 
         # Fade
         if tail != 0:
@@ -587,16 +771,17 @@ def bouncing_ball(leds: int, color: RGBColor = MAIN_COLOR, tail: float = 2,
             tail_start_i = max(1, min(int(pos + 1), tail_vel_pos))
             tail_end_i = min(leds - 1, max(int(pos + 1), tail_vel_pos + 1))
             length = tail_end_i - tail_start_i
-            for i, tail_i in enumerate(range(tail_start_i, tail_end_i)):
+            if length > 0:
+                tail_opa = img.opa[tail_start_i:tail_end_i]
+                divide(ramp[:length], length, out=tail_opa)
                 if velocity < 0:
-                    img.opa[tail_i] = 1 - i / length
-                    continue
-                img.opa[tail_i] = i / length
+                    subtract(1, tail_opa, out=tail_opa)
+                dirty_start = min(dirty_start, tail_start_i)
+                dirty_end = max(dirty_end, tail_end_i)
 
         yield img
 
         # Next frame calculation
-        img.fill(opa=0.)
         if int(pos) == 0:
             velocity *= -elasticity
         velocity -= gravity
@@ -610,11 +795,11 @@ def bouncing_ball(leds: int, color: RGBColor = MAIN_COLOR, tail: float = 2,
             break
 
 
-def flame(leds: int,  # pylint: disable=W0102
+def flame(leds: int,
           cooling: float = 100,
           sparks: int = 3,
           spark_prob: float = 0.1,
-          heat_kernel: list = [.25, .4, .25, .1]):
+          heat_kernel: tuple = (.25, .4, .25, .1)):
     """Infinite flame generator.
 
     This visual simulates a burning flame with a heat sport at the base
@@ -633,7 +818,7 @@ def flame(leds: int,  # pylint: disable=W0102
         Number of new sparks to attempt to create each frame
     spark_prob : float, optional
         Probability of each spark being created
-    heat_kernel : list, optional
+    heat_kernel : tuple, optional
         Kernel used for heat diffusion
 
     Notes
@@ -641,37 +826,49 @@ def flame(leds: int,  # pylint: disable=W0102
     - :mod:`lsd.modifiers` can be used to change the color of the flame.
     """
 
-    heat_kernel /= array(heat_kernel).sum()
+    heat_kernel = array(heat_kernel, dtype=float)
+    heat_kernel /= heat_kernel.sum()
     img = Image(leds, opa=0.)
-    heat = zeros(leds)
-
-    while RUNNING:
+    base_pixels = len(heat_kernel) - 1
+    padded_heat = zeros(base_pixels + leds)  # Base pixels below the strip
+    heat = padded_heat[base_pixels:]
+    cooldown = zeros(leds)
+    spark_range = max(1, int(leds * 0.075))
+    is_running = _RUNNING.is_set
+
+    # Color and opacity for quantized heat levels
+    heat_steps, heat_max = 1024, 5000
+    heat_scale = (heat_steps - 1) / heat_max
+    heat_levels = linspace(0, heat_max, heat_steps)
+    heat_lut = zeros((heat_steps, 4), dtype=float32)
+    heat_lut[:, :3] = heat_color_vec(heat_levels)
+    heat_lut[:, 3] = 1 / (1 + exp(-10 * (heat_levels / 2500 - 0.25)))
+    levels = zeros(leds, dtype=int)
+    pixels = zeros((leds, 4), dtype=float32)
+
+    while is_running():
 
         # Cool off
-        heat -= rng.integers(0, cooling)  # type: ignore
-        heat[heat < 0] = 0
-
-        # Heat diffusion upward
-        heat_origin = heat[0]
-        for pos in range(leds - 1, -len(heat_kernel), -1):
-            heat_val = heat[pos]
-            if pos < 0:
-                heat_val = heat_origin
-            heat[pos] = 0
-            for k_pos, k_val in enumerate(heat_kernel):
-                if pos + k_pos < leds and pos + k_pos >= 0:
-                    heat[pos + k_pos] += heat_val * k_val
+        rng.random(out=cooldown)
+        cooldown *= cooling
+        heat -= cooldown
+        maximum(heat, 0, out=heat)
+
+        # Heat diffusion upward, the base heat extends below the strip
+        padded_heat[:base_pixels] = heat[0]
+        heat[:] = convolve(padded_heat, heat_kernel, mode='valid')
 
         # New sparks
         heat[0] = rng.integers(1000, 2000)
-        for _ in range(sparks):
-            if rng.random() < spark_prob:
-                spark_pos = rng.integers(0, int(leds * 0.075))
-                heat[spark_pos] += rng.integers(1500, 3000)
+        ignited = rng.random(sparks) < spark_prob
+        spark_pos = rng.integers(0, spark_range, size=sparks)
+        spark_heat = rng.integers(1500, 3000, size=sparks)
+        add.at(heat, spark_pos[ignited], spark_heat[ignited])
 
         # Convert heat to color
-        for i in range(len(img)):
-            img[i] = heat_color(heat[i])
-            img.opa[i] = 1 / (1 + exp(-10 * (heat[i] / 2500 - 0.25)))
+        multiply(heat, heat_scale, out=levels, casting='unsafe')
+        take(heat_lut, levels, axis=0, out=pixels, mode='clip')
+        img[:] = pixels[:, :3]
+        img.opa[:] = pixels[:, 3]
 
         yield img
@@ -6,10 +6,12 @@
 
 
 import unittest
-from numpy.testing import assert_array_equal
+from unittest.mock import patch
+from numpy.testing import assert_array_equal, assert_allclose
 
-from lsd.strip import Animation
-from lsd.visuals import blink
+from lsd.strip import Animation, Strip
+from lsd.visuals import (
+    blink, set_running, runner, runner_batch, finite_to_batch, batch_frames)
 from lsd import MAIN_COLOR
 from lsd.colors import black
 
@@ -43,11 +45,86 @@ class TestAnimation(unittest.TestCase):
         assert_array_equal(frame_on, [MAIN_COLOR] * self.anim.n)
         assert_array_equal(frame_off, [black] * self.anim.n)
 
+        # Copied frames
+        anim = Animation(blink(10, on_frames=1, off_frames=1,
+                               copy_on_yield=True), 10)
+        anim.__next_frame__()
+        assert_array_equal(anim.cmp, frame_on)
+        anim.__next_frame__()
+        assert_array_equal(anim.cmp, frame_off)
+
+        # Repeated read-only frames
+        anim = Animation(blink(10, on_frames=2, off_frames=1), 10)
+        anim.__next_frame__()
+        anim.fill((1, 2, 3), opa=.5)
+        anim.__next_frame__()
+        assert_array_equal(anim.cmp, frame_on)
+        assert_array_equal(anim.opa, [1.] * anim.n)
+        anim.__next_frame__()
+        assert_array_equal(anim.cmp, frame_off)
+
         # Disabled playback
         self.anim.set_playback(False)
         self.anim.__next_frame__()
         assert_array_equal(self.anim.cmp, frame_off)
 
+    def test_stopped_visuals(self):
+        """Tests that stopped visuals end the animation playback."""
+
+        set_running(False)
+        try:
+            anim = Animation(blink, 10)
+            anim.__next_frame__()
+            self.assertFalse(anim.playback)
+        finally:
+            set_running(True)
+        anim = Animation(blink, 10)
+        anim.__next_frame__()
+        self.assertTrue(anim.playback)
+
+    def test_batched_frames(self):
+        """Tests batched frames match the generated frames."""
+
+        batch = runner_batch(10, width=1.5, step_size=.3)
+        frames = finite_to_batch(runner(10, width=1.5, step_size=.3))
+        assert_allclose(batch, frames, atol=1e-6)
+        self.assertEqual(len(finite_to_batch(blink(10), 5)), 5)
+
+        anim = Animation(batch_frames(batch), 10)
+        for frame in batch:
+            anim.__next_frame__()
+            assert_array_equal(anim[:], frame[:, :3])
+            assert_array_equal(anim.opa, frame[:, 3])
+        anim.__next_frame__()
+        self.assertFalse(anim.playback)
+
+    def test_play_on_pacing(self):
+        """Tests frames are paced by deadlines in ``play_on()``."""
+
+        strip = Strip(10, hide_display=True)
+        anim = Animation(blink, 10)
+        now = [0]
+        sleeps = []
+        show_times = iter([10, 50, 150, 10])  # [ms]
+
+        def fake_sleep(sec):
+            if sec > 0:
+                sleeps.append(round(sec * 1e3))
+                now[0] += int(sec * 1e9)
+
+        def fake_show(**_):
+            now[0] += next(show_times) * 1_000_000
+
+        with patch('lsd.strip.perf_counter_ns', lambda: now[0]), \
+             patch('lsd.strip.sleep', fake_sleep), \
+             patch.object(strip, 'show', side_effect=fake_show) as show:
+            anim.play_on(strip, fps=10, max_dur=.4)
+
+        # A slow frame shortens the next sleep, a late frame resyncs
+        # the deadline instead of bursting the following frames
+        self.assertEqual(sleeps, [90, 50, 90])
+        self.assertEqual(show.call_count, 4)
+
 
 if __name__ == '__main__':
     unittest.main()
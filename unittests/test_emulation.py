@@ -6,6 +6,7 @@
 
 
 import unittest
+from numpy import array, asarray
 from numpy.testing import assert_array_equal
 
 from lsd.utils.emulation import NeoPixel
@@ -23,6 +24,15 @@ class TestEmulation(unittest.TestCase):
         neopixel.fill((255, 0, 0))
         assert_array_equal(neopixel, [(255, 0, 0)] * pixels)
         neopixel[2] = (0, 255, 0)
+
+        # Array conversion copies unless asked not to
+        pixel_data = asarray(neopixel)
+        self.assertTrue(pixel_data.flags.c_contiguous)
+        pixel_data[0] = 0
+        assert_array_equal(neopixel[0], (255, 0, 0))
+        self.assertEqual(asarray(neopixel, dtype=float).dtype, float)
+        with self.assertRaises(ValueError):
+            array(neopixel, dtype=float, copy=False)
         neopixel.close()
 
 
@@ -20,6 +20,9 @@ class TestFormatting(unittest.TestCase):
         self.assertEqual(format_time(0.001), '1.00 ms')
         self.assertEqual(format_time(0.000001), '1.00 µs')
         self.assertEqual(format_time(0.000000001), '1.00 ns')
+        self.assertEqual(format_time(0.0000000005), '0.50 ns')
+        self.assertEqual(format_time(0), '0.00 ns')
+        self.assertEqual(format_time(-0.5), '-500.00 ms')
         self.assertEqual((format_time(60, 0)), '1 min')
         self.assertEqual(format_time(60, 1), '1.0 min')
         self.assertEqual(format_time(60, 3), '1.000 min')
@@ -8,7 +8,7 @@
 
 
 import unittest
-from numpy import array
+from numpy import array, uint8, float64
 from numpy.testing import assert_array_equal, assert_array_almost_equal
 
 from lsd.strip import Image
@@ -200,6 +200,32 @@ class TestImage(unittest.TestCase):
         self.img.set(0, red, True)
         self.assertEqual(self.img.opa[0], 1)
 
+    def test_set_int_fast(self):
+        """Tests ``set_int_fast()`` method."""
+
+        self.img.set_int_fast(0, blue)
+        self.img.set_int_fast(-1, red)
+        assert_array_almost_equal(self.img.raw_img, [blue, cyan, red])
+        with self.assertRaises(IndexError):
+            self.img.set_int_fast(3, red)
+
+    def test_uint8_writes(self):
+        """Tests writes to ``uint8`` images are clipped."""
+
+        img = Image(3, dtype=uint8)
+        img[0] = (300, 0, 0)
+        img[1:] = array([[-5, 256, 20], [0, 1000, 255]])
+        assert_array_equal(img.raw_img, [[255, 0, 0], [0, 255, 20],
+                                         [0, 255, 255]])
+        img.set(2, array([300, -1, 7]))
+        img.set_int_fast(1, (1.5, 270, -3))
+        assert_array_equal(img.raw_img, [[255, 0, 0], [1, 255, 0],
+                                         [255, 0, 7]])
+
+        # String dtypes still use the packed buffer
+        img = Image(3, dtype='float32')
+        self.assertEqual(img.opa.base.shape, (3, 4))
+
     def test_fill(self):
         """Tests ``fill()`` method."""
 
@@ -210,6 +236,11 @@ class TestImage(unittest.TestCase):
         assert_array_almost_equal(self.img.raw_img, [green] * self.img.n)
         assert_array_almost_equal(self.img.opa, [0.5] * self.img.n)
 
+        # Integer images are clipped to the RGB range
+        img = Image(3, dtype=uint8)
+        img.fill((300, 20.5, -4))
+        assert_array_equal(img.raw_img, [[255, 20, 0]] * 3)
+
         # Invalid cases
         with self.assertRaises(AssertionError):
             self.img.fill(True)
@@ -342,6 +373,13 @@ class TestImage(unittest.TestCase):
              [0, 255, 127.5],
              [25.5, 0, 255]])
 
+        # The image dtype takes part in the promotion
+        img = Image([[10.5, 20., 30.], [1., 2., 3.]], opa=[1, 0],
+                    bg=array([[7, 8, 9], [4, 5, 6]]))
+        cmp = img.composite
+        assert_array_equal(cmp, [[10.5, 20, 30], [4, 5, 6]])
+        self.assertEqual(cmp.dtype, float64)
+
 
 if __name__ == '__main__':
     unittest.main()
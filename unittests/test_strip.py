@@ -7,6 +7,7 @@
 
 
 import unittest
+from unittest.mock import patch
 from numpy.testing import assert_array_equal
 
 from lsd.strip import Strip, Image
@@ -77,6 +78,34 @@ class TestStrip(unittest.TestCase):
         with self.assertRaises(AssertionError):
             assert_array_equal(self.strip.displayed, self.strip.raw_img)
 
+    def test_show_unchanged_frames(self):
+        """Tests only changed frames are sent to the strip driver."""
+
+        strip = Strip(3, hide_display=True)
+        with patch.object(strip.strip_driver, 'show') as driver_show:
+            # The first frame is always written, even if it is black
+            strip.show()
+            self.assertEqual(driver_show.call_count, 1)
+
+            # Same frame again
+            strip.show()
+            self.assertEqual(driver_show.call_count, 1)
+
+            # Changed frame
+            strip.fill(red)
+            strip.show()
+            self.assertEqual(driver_show.call_count, 2)
+            assert_array_equal(strip.displayed, [red] * strip.n)
+
+            # Out of range colors are clipped before they are compared
+            strip.fill((300, -1, 0))
+            strip.show()
+            self.assertEqual(driver_show.call_count, 2)
+            strip.fill((44, 255, 0))
+            strip.show()
+            self.assertEqual(driver_show.call_count, 3)
+            assert_array_equal(strip.displayed, [(44, 255, 0)] * strip.n)
+
 
 if __name__ == '__main__':
     unittest.main()
@@ -34,6 +34,12 @@ class TestFormatting(unittest.TestCase):
         self.assertFalse(is_color_value('not a color'))
         self.assertFalse(is_color_value(123))
         self.assertFalse(is_color_value(None))
+        self.assertFalse(is_color_value(array([True, False, True])))
+
+        # Generators are rejected without being consumed
+        gen = (x for x in (255, 0, 0))
+        self.assertFalse(is_color_value(gen))
+        self.assertEqual(list(gen), [255, 0, 0])
 
         # Extreme cases
         self.assertFalse(is_color_value(zeros((100000,))))
@@ -68,6 +74,10 @@ class TestFormatting(unittest.TestCase):
             array([[-10, 264, 253], [15, 30, 50]], dtype=bool)))
         self.assertTrue(is_img_data(array([[1, 1, 1]], dtype=bool)))
         self.assertTrue(is_img_data(Image(5)))
+        self.assertTrue(is_img_data([(0, 120, 253), [0.5, 3.6, 20.8]]))
+        self.assertTrue(is_img_data([red, (1, 2, 3)]))
+        self.assertTrue(is_img_data([[True, False, True]]))
+        self.assertTrue(is_img_data([]))
 
         # Invalid cases
         self.assertFalse(is_img_data([255, 0, 0]))
@@ -78,6 +88,12 @@ class TestFormatting(unittest.TestCase):
         self.assertFalse(is_img_data(array([[0, 1, 2, 3], [4, 5, 6, 7]])))
         self.assertFalse(is_img_data(array([[[0.5, 0.5, 0.5]]], dtype=float)))
         self.assertFalse(is_img_data(array([[[255, 0, 0]]])))
+        self.assertFalse(is_img_data([['0', '1', '2'], ['3', '4', '5']]))
+        self.assertFalse(is_img_data([[0, 1, 2], [3, 4]]))
+        self.assertFalse(is_img_data([[]]))
+        gen = ((0, 1, 2) for _ in range(2))
+        self.assertFalse(is_img_data(gen))
+        self.assertEqual(len(list(gen)), 2)
 
         # Extreme cases
         self.assertTrue(is_img_data(Image(100000)))